@@ -8,6 +8,8 @@ logger = logging.getLogger('uberwriter')
 
 class FixTable():
 
+    SPACES = re.compile(r"\s\s+")
+
     def __init__(self, TextBuffer):
         self.TextBuffer = TextBuffer
 
@@ -77,13 +79,12 @@ class FixTable():
         # obtiene las columnas de toda la tabla.
         columns = zip(*content)
         # calcula el tamano maximo que debe tener cada columna.
-        # replace with len()
-        widths = [max([len(x) for x in i]) for i in columns]
+        widths = [max(map(len, i)) for i in columns]
 
         result = []
 
         result.append(FixTable.create_seperator(widths, '-'))
-        print(content, widths)
+        logger.debug("%s %s", content, widths)
         result.append(FixTable.create_line(content[0], widths))
         result.append(FixTable.create_seperator(widths, '='))
 
@@ -103,7 +104,15 @@ class FixTable():
         "Line in a paragraph?"
         return len(current_line.strip()) >= 1
 
-    def get_table_bounds(self, are_in_callback):
+    def get_lines(self):
+        """Return the whole buffer split into lines"""
+        buf = self.TextBuffer
+        start_iter = buf.get_start_iter()
+        end_iter = buf.get_end_iter()
+
+        return buf.get_text(start_iter, end_iter, False).split('\n')
+
+    def get_table_bounds(self, are_in_callback, text=None):
         """
             Gets the row number where the table begins and ends.
             are_in_callback argument must be a function
@@ -113,11 +122,9 @@ class FixTable():
         """
         top = 0
 
-        buf = self.TextBuffer
-        start_iter = buf.get_start_iter()
-        end_iter = buf.get_end_iter()
-
-        text = self.TextBuffer.get_text(start_iter, end_iter, False).split('\n')
+        # `text` may be passed in if the lines were already fetched
+        if text is None:
+            text = self.get_lines()
         logger.debug(text)
         length = len(text)
         bottom = length - 1
@@ -141,11 +148,11 @@ class FixTable():
     @staticmethod
     def remove_spaces(string):
         """Remove unnecessary spaces"""
-        return re.sub("\s\s+", " ", string)
+        return FixTable.SPACES.sub(" ", string)
 
     @staticmethod
     def create_separators_removing_spaces(string):
-        return re.sub("\s\s+", "|", string)
+        return FixTable.SPACES.sub("|", string)
 
     @staticmethod
     def extract_cells_as_list(string):
@@ -186,17 +193,16 @@ class FixTable():
         line_text = self.TextBuffer.get_text(cursor_iter, end_line, False)
         if FixTable.are_in_a_table(line_text):
 
+            # the buffer is only read and split once for bounds and cells
+            text = self.get_lines()
+
             # obtiene el indice donde comienza y termina la tabla.
-            r1, r2 = self.get_table_bounds(FixTable.are_in_a_table)
+            r1, r2 = self.get_table_bounds(FixTable.are_in_a_table, text)
 
             logger.debug('asdasd ')
 
             # extrae de la tabla solo las celdas de texto
-            buf = self.TextBuffer
-            start_iter = buf.get_start_iter()
-            end_iter = buf.get_end_iter()
-
-            text = self.TextBuffer.get_text(start_iter, end_iter, False).split('\n')
+            start_iter = self.TextBuffer.get_start_iter()
 
             table_as_list = FixTable.extract_table(text, r1, r2)
             logger.debug(table_as_list)
@@ -207,4 +213,3 @@ class FixTable():
             self.TextBuffer.insert(start_iter, table_content, -1)
         else:
             logger.debug("Not in a table")
-            print("Not in table")
@@ -25,6 +25,7 @@ class MarkupBuffer():
 
     def __init__(self, Parent, TextBuffer, base_leftmargin):
         self.multiplier = 10
+        self.margin_params = None
         self.parent = Parent
         self.text_buffer = TextBuffer
 
@@ -120,8 +121,26 @@ class MarkupBuffer():
         "LINK": re.compile(r"\(http(.+?)\)")
     }
 
+    # Characters of which at least one must be in the text for the
+    # pattern to match. Scanning for them is far cheaper than running
+    # the regex, especially the line anchored ones.
+    triggers = {
+        "ITALIC": "*_",
+        "STRONG": "*_",
+        "STRONGITALIC": "*_",
+        "BLOCKQUOTE": ">",
+        "STRIKETHROUGH": "~",
+        "LIST": "-*+",
+        "INDENTEDLIST": "\t",
+        "HEADINDICATOR": "#",
+        "HEADLINE": "#",
+        "MATH": "$"
+    }
+
     def markup_buffer(self, mode=0):
         buf = self.text_buffer
+        regex = self.regex
+        triggers = self.triggers
 
         # Test for shifting first line
         # bbs = buf.get_start_iter()
@@ -148,119 +167,128 @@ class MarkupBuffer():
 
         text = buf.get_slice(context_start, context_end, False)
 
-        self.text_buffer.remove_tag(self.italic, context_start, context_end)
+        def find(name):
+            """iterate over the matches of the named regex in text, skipping
+               the scan if none of its trigger characters are present
+            """
+            chars = triggers.get(name)
+            if chars is not None and not any(char in text for char in chars):
+                return ()
+            return regex[name].finditer(text)
+
+        buf.remove_tag(self.italic, context_start, context_end)
 
-        matches = re.finditer(self.regex["ITALIC"], text)
+        matches = find("ITALIC")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.italic, start_iter, end_iter)
+            buf.apply_tag(self.italic, start_iter, end_iter)
 
-        self.text_buffer.remove_tag(self.emph, context_start, context_end)
+        buf.remove_tag(self.emph, context_start, context_end)
 
-        matches = re.finditer(self.regex["STRONG"], text)
+        matches = find("STRONG")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.emph, start_iter, end_iter)
+            buf.apply_tag(self.emph, start_iter, end_iter)
 
-        matches = re.finditer(self.regex["STRONGITALIC"], text)
+        matches = find("STRONGITALIC")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.bolditalic, start_iter, end_iter)
+            buf.apply_tag(self.bolditalic, start_iter, end_iter)
 
-        self.text_buffer.remove_tag(self.strikethrough, context_start, context_end)
+        buf.remove_tag(self.strikethrough, context_start, context_end)
 
-        matches = re.finditer(self.regex["STRIKETHROUGH"], text)
+        matches = find("STRIKETHROUGH")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.strikethrough, start_iter, end_iter)
+            buf.apply_tag(self.strikethrough, start_iter, end_iter)
 
-        self.text_buffer.remove_tag(self.green_text, context_start, context_end)
+        buf.remove_tag(self.green_text, context_start, context_end)
 
-        matches = re.finditer(self.regex["MATH"], text)
+        matches = find("MATH")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.green_text, start_iter, end_iter)
+            buf.apply_tag(self.green_text, start_iter, end_iter)
 
         for margin in self.rev_leftmargin:
-            self.text_buffer.remove_tag(margin, context_start, context_end)
+            buf.remove_tag(margin, context_start, context_end)
 
-        matches = re.finditer(self.regex["LIST"], text)
+        matches = find("LIST")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.rev_leftmargin[0], start_iter, end_iter)
+            buf.apply_tag(self.rev_leftmargin[0], start_iter, end_iter)
 
-        matches = re.finditer(self.regex["NUMERICLIST"], text)
+        matches = find("NUMERICLIST")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
             index = len(match.group(1)) - 1
             if index < len(self.rev_leftmargin):
                 margin = self.rev_leftmargin[index]
-                self.text_buffer.apply_tag(margin, start_iter, end_iter)
+                buf.apply_tag(margin, start_iter, end_iter)
 
-        matches = re.finditer(self.regex["BLOCKQUOTE"], text)
+        matches = find("BLOCKQUOTE")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
             index = len(match.group(1)) - 2
             if index < len(self.leftmargin):
-                self.text_buffer.apply_tag(self.leftmargin[index], start_iter, end_iter)
+                buf.apply_tag(self.leftmargin[index], start_iter, end_iter)
 
         for leftindent in self.leftindent:
-            self.text_buffer.remove_tag(leftindent, context_start, context_end)
+            buf.remove_tag(leftindent, context_start, context_end)
 
-        matches = re.finditer(self.regex["INDENTEDLIST"], text)
+        matches = find("INDENTEDLIST")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
             index = (len(match.group(1)) - 1) * 2 + len(match.group(2))
             if index < len(self.leftindent):
-                self.text_buffer.apply_tag(self.leftindent[index], start_iter, end_iter)
+                buf.apply_tag(self.leftindent[index], start_iter, end_iter)
 
-        matches = re.finditer(self.regex["HEADINDICATOR"], text)
+        matches = find("HEADINDICATOR")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
             index = len(match.group(1)) - 1
             if index < len(self.rev_leftmargin):
                 margin = self.rev_leftmargin[index]
-                self.text_buffer.apply_tag(margin, start_iter, end_iter)
+                buf.apply_tag(margin, start_iter, end_iter)
 
-        matches = re.finditer(self.regex["HORIZONTALRULE"], text)
+        matches = find("HORIZONTALRULE")
         rulecontext = context_start.copy()
         rulecontext.forward_lines(3)
-        self.text_buffer.remove_tag(self.centertext, rulecontext, context_end)
+        buf.remove_tag(self.centertext, rulecontext, context_end)
 
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             start_iter.forward_chars(2)
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.centertext, start_iter, end_iter)
+            buf.apply_tag(self.centertext, start_iter, end_iter)
 
-        matches = re.finditer(self.regex["HEADLINE"], text)
+        matches = find("HEADLINE")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.emph, start_iter, end_iter)
+            buf.apply_tag(self.emph, start_iter, end_iter)
 
-        matches = re.finditer(self.regex["HEADLINE_TWO"], text)
-        self.text_buffer.remove_tag(self.headline_two, rulecontext, context_end)
+        matches = find("HEADLINE_TWO")
+        buf.remove_tag(self.headline_two, rulecontext, context_end)
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.headline_two, start_iter, end_iter)
+            buf.apply_tag(self.headline_two, start_iter, end_iter)
 
-        matches = re.finditer(self.regex["TABLE"], text)
+        matches = find("TABLE")
         for match in matches:
             start_iter = buf.get_iter_at_offset(context_offset + match.start())
             end_iter = buf.get_iter_at_offset(context_offset + match.end())
-            self.text_buffer.apply_tag(self.table_env, start_iter, end_iter)
+            buf.apply_tag(self.table_env, start_iter, end_iter)
 
         if self.parent.focusmode:
             self.focusmode_highlight()
@@ -302,14 +330,20 @@ class MarkupBuffer():
 
     def recalculate(self, lm):
         multiplier = self.multiplier
+        # configure-event fires on every move and resize of the window;
+        # changing tag properties relayouts the whole buffer, so only do
+        # it if the margins would actually change
+        if self.margin_params == (lm, multiplier):
+            return
+        self.margin_params = (lm, multiplier)
         for i in range(0, 6):
             new_margin = (lm - multiplier) - multiplier * (i + 1)
-            self.rev_leftmargin[i].set_property("left-margin", 0 if new_margin < 0 else new_margin)
+            self.rev_leftmargin[i].set_property("left-margin", max(0, new_margin))
             self.rev_leftmargin[i].set_property("indent", - multiplier * (i + 1) - multiplier)
 
         for i in range(0, 6):
             new_margin = (lm - multiplier) + multiplier + multiplier * (i + 1)
-            self.leftmargin[i].set_property("left-margin", 0 if new_margin < 0 else new_margin)
+            self.leftmargin[i].set_property("left-margin", max(0, new_margin))
             self.leftmargin[i].set_property("indent", - (multiplier - 1) * (i + 1) - multiplier)
 
     def dark_mode(self, active=False):
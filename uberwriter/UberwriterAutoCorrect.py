@@ -6,6 +6,7 @@
 import os
 import pickle
 import configparser
+import logging
 
 import xml.etree.ElementTree as ET
 
@@ -24,6 +25,8 @@ from uberwriter_lib import pressagio
 
 from uberwriter_lib.helpers import get_media_path
 
+LOGGER = logging.getLogger('uberwriter')
+
 # Define and create PresageCallback object
 class PressagioCallback(pressagio.callback.Callback):
     def __init__(self, buffer):
@@ -38,6 +41,10 @@ class PressagioCallback(pressagio.callback.Callback):
 
 class UberwriterAutoCorrect:
 
+    DISMISS_KEYS = frozenset((Gdk.KEY_Escape, Gdk.KEY_BackSpace))
+    ACCEPT_CHARS = frozenset((' ', '\t', '\n', '.', '?', '!',
+                              ',', ';', '\'', '"', ')', ':'))
+
     def show_bubble(self, iterator, suggestion):
         self.suggestion = suggestion
         if self.bubble:
@@ -100,7 +107,7 @@ class UberwriterAutoCorrect:
             suggestions_map.sort(key=lambda x: x['freq'])
             suggestions_map.reverse()
             prediction = suggestions_map[0]
-            print(predictions)
+            LOGGER.debug(predictions)
             prediction = predictions[0]
         else:
             prediction = predictions[0].word
@@ -134,7 +141,6 @@ class UberwriterAutoCorrect:
             frequency_file.close()
 
     def accept_suggestion(self, append=""):
-        print("called")
         curr_iter = self.buffer.get_iter_at_mark(self.buffer.get_insert())
         start_iter = curr_iter.copy()
         start_iter.backward_visible_word_start()
@@ -145,7 +151,7 @@ class UberwriterAutoCorrect:
     def key_pressed(self, _widget, event):
         if not self.bubble:
             return False
-        if event.keyval in [Gdk.KEY_Escape, Gdk.KEY_BackSpace]:
+        if event.keyval in self.DISMISS_KEYS:
             self.destroy_bubble()
         return False
 
@@ -154,8 +160,7 @@ class UberwriterAutoCorrect:
         # check if at end of a word
         # if yes, check if suggestion available
         # then display suggetion
-        if self.suggestion and text in [' ', '\t', '\n', '.', '?', '!',
-                                        ',', ';', '\'', '"', ')', ':']:
+        if self.suggestion and text in self.ACCEPT_CHARS:
             self.accept_suggestion(append=text)
             location.assign(self.buffer.get_iter_at_mark(self.buffer.get_insert()))
         elif location.ends_word():
@@ -172,7 +177,7 @@ class UberwriterAutoCorrect:
         self.disabled = False
 
     def set_language(self, language):
-        print("Language changed to: %s" % language)
+        LOGGER.debug("Language changed to: %s", language)
 
         # handle 2 char cases e.g. "en"
         if len(language) == 2:
@@ -183,7 +188,6 @@ class UberwriterAutoCorrect:
             return
 
         self.language = language
-        print("Language changing")
         config_file = get_media_path("pressagio_config.ini")
         pres_config = configparser.ConfigParser()
         pres_config.read(config_file)
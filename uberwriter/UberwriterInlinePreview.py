@@ -15,6 +15,7 @@
 # END LICENSE
 
 import re
+import functools
 import urllib
 from urllib.error import URLError
 import webbrowser
@@ -38,6 +39,21 @@ from .MarkupBuffer import MarkupBuffer
 
 LOGGER = logging.getLogger('uberwriter')
 
+FOOTNOTE = re.compile(r'\[\^([^\s]+?)\]')
+IMAGE = re.compile(r"!\[(.*?)\]\((.+?)\)")
+INDENT = re.compile(r"^\t", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=256)
+def footnote_definition(identifier):
+    """Return the compiled regex matching the definition of a footnote,
+       cached by its identifier
+    """
+    return re.compile(
+        r"\[\^" + re.escape(identifier) + r"\]: (.+(?:\n|\Z)(?:^[\t].+(?:\n|\Z))*)",
+        re.MULTILINE)
+
+
 GObject.threads_init()  # Still needed?
 
 # TODO:
@@ -366,12 +382,9 @@ class UberwriterInlinePreview():
         math = MarkupBuffer.regex["MATH"]
         link = MarkupBuffer.regex["LINK"]
 
-        footnote = re.compile(r'\[\^([^\s]+?)\]')
-        image = re.compile(r"!\[(.*?)\]\((.+?)\)")
-
         found_match = False
 
-        matches = re.finditer(math, text)
+        matches = math.finditer(text)
         for match in matches:
             LOGGER.debug(match.group(1))
             if match.start() < line_offset < match.end():
@@ -401,7 +414,7 @@ class UberwriterInlinePreview():
 
         if not found_match:
             # Links
-            matches = re.finditer(link, text)
+            matches = link.finditer(text)
             for match in matches:
                 if match.start() < line_offset < match.end():
                     text = text[text.find("http://"):-1]
@@ -450,7 +463,7 @@ class UberwriterInlinePreview():
                     break
 
         if not found_match:
-            matches = re.finditer(image, text)
+            matches = IMAGE.finditer(text)
             for match in matches:
                 if match.start() < line_offset < match.end():
                     path = match.group(2)
@@ -480,22 +493,18 @@ class UberwriterInlinePreview():
                     break
 
         if not found_match:
-            matches = re.finditer(footnote, text)
+            matches = FOOTNOTE.finditer(text)
             for match in matches:
                 if match.start() < line_offset < match.end():
                     LOGGER.debug(match.group(1))
-                    footnote_match = re.compile(
-                        r"\[\^" + match.group(1) + r"\]: (.+(?:\n|\Z)(?:^[\t].+(?:\n|\Z))*)",
-                        re.MULTILINE)
-                    replace = re.compile(r"^\t", re.MULTILINE)
                     start, end = self.text_buffer.get_bounds()
-                    fn_match = re.search(
-                        footnote_match, self.text_buffer.get_text(start, end, False))
+                    fn_match = footnote_definition(match.group(1)).search(
+                        self.text_buffer.get_text(start, end, False))
                     label = Gtk.Label()
                     label.set_alignment(0.0, 0.5)
                     LOGGER.debug(fn_match)
                     if fn_match:
-                        result = re.sub(replace, "", fn_match.group(1))
+                        result = INDENT.sub("", fn_match.group(1))
                         if result.endswith("\n"):
                             result = result[:-1]
                     else:
@@ -80,7 +80,7 @@ class UberwriterSearchAndReplace():
     def key_pressed(self, _widget, event, _data=None):
         """hide the search and replace content box when ESC is pressed
         """
-        if event.keyval in [Gdk.KEY_Escape]:
+        if event.keyval == Gdk.KEY_Escape:
             self.hide()
 
     def focused_texteditor(self, _widget, _data=None):
@@ -164,11 +164,17 @@ class UberwriterSearchAndReplace():
         self.replace(self.active)
 
     def replace_all(self, _widget=None, _data=None):
-        while self.matchiters:
-            match = self.matchiters[0]
-            self.textbuffer.delete(match[0], match[1])
-            self.textbuffer.insert(match[0], self.replaceentry.get_text())
-            self.search(scroll=False)
+        replacement = self.replaceentry.get_text()
+        offsets = [(match[0].get_offset(), match[1].get_offset())
+                   for match in self.matchiters]
+        # replace back to front, so the offsets of the remaining matches
+        # stay valid and the buffer is only searched once more at the end
+        for start, end in reversed(offsets):
+            start_iter = self.textbuffer.get_iter_at_offset(start)
+            end_iter = self.textbuffer.get_iter_at_offset(end)
+            self.textbuffer.delete(start_iter, end_iter)
+            self.textbuffer.insert(start_iter, replacement)
+        self.search(scroll=False)
 
     def replace(self, searchindex, _inloop=False):
         match = self.matchiters[searchindex]
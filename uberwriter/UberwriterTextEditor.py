@@ -56,6 +56,8 @@ LOGGER = logging.getLogger('uberwriter')
 
 class UndoableInsert:
     """something that has been inserted into our textbuffer"""
+    __slots__ = ('offset', 'text', 'length', 'mergeable')
+
     def __init__(self, text_iter, text, length):
         self.offset = text_iter.get_offset()
         self.text = text
@@ -68,6 +70,8 @@ class UndoableInsert:
 
 class UndoableDelete:
     """something that has ben deleted from our textbuffer"""
+    __slots__ = ('text', 'start', 'end', 'delete_key_used', 'mergeable')
+
     def __init__(self, text_buffer, start_iter, end_iter):
         self.text = text_buffer.get_text(start_iter, end_iter, False)
         self.start = start_iter.get_offset()
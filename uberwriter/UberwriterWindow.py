@@ -15,7 +15,6 @@
 # END LICENSE
 
 import locale
-import subprocess
 import os
 import codecs
 import webbrowser
@@ -66,6 +65,7 @@ CONFIG_PATH = os.path.expanduser("~/.config/uberwriter/")
 class UberwriterWindow(Gtk.ApplicationWindow):
 
     WORDCOUNT = re.compile(r"(?!\-\w)[\s#*\+\-]+", re.UNICODE)
+    SCROLL_MARKS = frozenset(('insert', 'gtk_drag_target'))
 
     def __init__(self, app):
         """Set up the main window"""
@@ -213,7 +213,7 @@ class UberwriterWindow(Gtk.ApplicationWindow):
             'drag-data-received', self.on_drag_data_received)
 
         def on_drop(_widget, *_args):
-            print("drop")
+            LOGGER.debug("drop")
         self.text_editor.connect('drag-drop', on_drop)
 
         self.text_buffer.connect('paste-done', self.paste_done)
@@ -315,7 +315,7 @@ class UberwriterWindow(Gtk.ApplicationWindow):
             return
         self.char_count.set_text(str(self.text_buffer.get_char_count()))
         text = self.get_text()
-        words = re.split(self.WORDCOUNT, text)
+        words = self.WORDCOUNT.split(text)
         length = len(words)
         # Last word a "space"
         if not words[-1]:
@@ -328,7 +328,7 @@ class UberwriterWindow(Gtk.ApplicationWindow):
         self.word_count.set_text(str(length))
 
     def mark_set(self, _buffer, _location, mark, _data=None):
-        if mark.get_name() in ['insert', 'gtk_drag_target']:
+        if mark.get_name() in self.SCROLL_MARKS:
             self.check_scroll(mark)
         return True
 
@@ -646,15 +646,11 @@ class UberwriterWindow(Gtk.ApplicationWindow):
         """Copies only html without headers etc. to Clipboard
         """
 
-        args = ['pandoc', '--from=markdown', '--to=html5']
-        proc = subprocess.Popen(args, stdin=subprocess.PIPE,
-                                stdout=subprocess.PIPE)
-
-        text = bytes(self.get_text(), "utf-8")
-        output = proc.communicate(text)[0]
+        args = ('pandoc', '--from=markdown', '--to=html5')
+        output = helpers.pandoc_convert(self.get_text(), args)
 
         clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        clipboard.set_text(output.decode("utf-8"), -1)
+        clipboard.set_text(output, -1)
         clipboard.store()
 
     def open_document(self, _widget=None):
@@ -839,7 +835,7 @@ class UberwriterWindow(Gtk.ApplicationWindow):
                 base_path = os.path.dirname(self.filename)
             else:
                 base_path = ''
-            os.environ['PANDOC_PREFIX'] = base_path + '/'
+            prefix = base_path + '/'
 
             # Set the styles according the color theme
             if self.settings.get_value("dark-mode"):
@@ -847,7 +843,7 @@ class UberwriterWindow(Gtk.ApplicationWindow):
             else:
                 stylesheet = helpers.get_media_path('github-md.css')
 
-            args = ['pandoc',
+            args = ('pandoc',
                     '-s',
                     '--from=markdown',
                     '--to=html5',
@@ -855,13 +851,10 @@ class UberwriterWindow(Gtk.ApplicationWindow):
                     '--css=' + stylesheet,
                     '--lua-filter=' +
                     helpers.get_script_path('relative_to_absolute.lua'),
-                    '--lua-filter=' + helpers.get_script_path('task-list.lua')]
-
-            proc = subprocess.Popen(
-                args, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+                    '--lua-filter=' + helpers.get_script_path('task-list.lua'))
 
-            text = bytes(self.get_text(), "utf-8")
-            output = proc.communicate(text)[0]
+            # toggling the preview without editing reuses the cached html
+            output = helpers.pandoc_convert(self.get_text(), args, prefix)
 
             # Load in Webview and scroll to #ID
             self.preview_webview = WebKit.WebView()
@@ -869,7 +862,7 @@ class UberwriterWindow(Gtk.ApplicationWindow):
             webview_settings.set_allow_universal_access_from_file_urls(
                 True)
             webview_settings.set_enable_developer_extras(opts.debug)
-            self.preview_webview.load_html(output.decode("utf-8"), 'file://localhost/')
+            self.preview_webview.load_html(output, 'file://localhost/')
 
             # Delete the cursor-scroll mark again
             # cursor_iter = self.TextBuffer.get_iter_at_mark(self.TextBuffer.get_insert())
@@ -976,7 +969,7 @@ class UberwriterWindow(Gtk.ApplicationWindow):
     def open_recent(self, _widget, data=None):
         """open the given recent document
         """
-        print("open")
+        LOGGER.debug("open")
 
         if data:
             if self.check_change() == Gtk.ResponseType.CANCEL:
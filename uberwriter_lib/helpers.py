@@ -20,6 +20,8 @@
 import logging
 import os
 import shutil
+import subprocess
+from functools import lru_cache
 
 
 import gi
@@ -29,6 +31,8 @@ from gi.repository import Gtk  # pylint: disable=E0611
 from . uberwriterconfig import get_data_file
 from . Builder import Builder
 
+LOGGER = logging.getLogger('uberwriter_lib')
+
 
 def get_builder(builder_file_name):
     """Return a fully-instantiated Gtk.Builder instance from specified ui
@@ -157,6 +161,54 @@ def exist_executable(command):
 
     return shutil.which(command) is not None
 
+
+def pandoc_env(prefix):
+    """return the environment for a pandoc run using relative_to_absolute.lua
+
+    Arguments:
+        prefix {str} -- base path relative links and images are resolved against
+
+    Returns:
+        {dict} -- a copy of os.environ with PANDOC_PREFIX set
+    """
+
+    return dict(os.environ, PANDOC_PREFIX=prefix)
+
+
+@lru_cache(maxsize=16)
+def _cached_pandoc_convert(text, args, prefix):
+    env = None
+    if prefix is not None:
+        env = pandoc_env(prefix)
+
+    proc = subprocess.Popen(args, stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, env=env)
+    output = proc.communicate(bytes(text, "utf-8"))[0].decode("utf-8")
+    if proc.returncode != 0:
+        # raising keeps failed runs out of the cache
+        raise subprocess.CalledProcessError(proc.returncode, args, output)
+    return output
+
+
+def pandoc_convert(text, args, prefix=None):
+    """run pandoc with the given arguments over a text and return the output,
+       reusing the output of recent identical successful conversions
+
+    Arguments:
+        text {str} -- the markdown text to convert
+        args {tuple} -- the pandoc command line
+        prefix {str} -- base path for the relative_to_absolute.lua filter
+
+    Returns:
+        {str} -- the converted text
+    """
+
+    try:
+        return _cached_pandoc_convert(text, args, prefix)
+    except subprocess.CalledProcessError as error:
+        LOGGER.warning("pandoc exited with status %s", error.returncode)
+        return error.output
+
 def get_descendant(widget, child_name, level, doPrint=False):
     if widget is not None:
         if doPrint: print("-"*level + str(Gtk.Buildable.get_name(widget)) +